@@ -6,11 +6,16 @@ import random  # Untuk menghasilkan data simulasi secara acak
 import cv2  # OpenCV untuk memproses video dan feed kamera
 import os  # Untuk berinteraksi dengan sistem operasi (misalnya, membuat direktori)
 import sys 
-import shutil  # Untuk operasi file tingkat tinggi (misalnya, menyalin file)
+import hashlib  # Untuk menghitung hash file model
+import zipfile  # File indeks .npz berbentuk zip, dipakai untuk menangkap file yang rusak
 import threading  # Untuk menjalankan proses (seperti video) secara paralel agar UI tidak macet
 import time  # Untuk memberikan jeda singkat dalam loop thread
+import json  # Untuk menyimpan profil/konfigurasi ke file
+from collections import deque  # Untuk menyimpan riwayat pengukuran (FPS, latensi) secara bergulir
 import openpyxl  # Untuk membaca dan menulis file Excel (.xlsx)
 from ultralytics import YOLO  # Yolo dari ultralytics
+import torch  # Backend ultralytics, dipakai untuk mengatur thread dan cek GPU
+import platform  # Untuk mengenali mesin saat menyimpan profil inferensi
 import numpy as np
 
 def resource_path(relative_path):
@@ -26,6 +31,759 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# --- Profil Capture Default ---
+# Nilai None berarti menggunakan pengaturan bawaan dari driver/backend.
+DEFAULT_CAPTURE_PROFILE = {
+    "backend": "auto",        # 'auto', 'v4l2', 'ffmpeg', 'dshow', 'msmf'
+    "width": None,            # Resolusi yang diminta ke kamera
+    "height": None,
+    "fourcc": None,           # Format kompresi, misalnya 'MJPG' agar USB tidak penuh
+    "fps": None,
+    "buffer_size": 1,         # Buffer minimal agar tidak ada frame basi yang menumpuk
+    "simulate_live": False,   # File video diperlakukan seperti kamera (frame dilewati sesuai waktu nyata)
+}
+
+DEFAULT_IMGSZ = 640  # Ukuran input bawaan model YOLO
+
+# --- Profil Inferensi Default ---
+# Nilai None berarti menggunakan pengaturan bawaan dari ultralytics/torch.
+DEFAULT_INFERENCE_PROFILE = {
+    "imgsz": None,     # Ukuran input model
+    "half": False,     # Half precision (FP16), hanya berlaku di GPU
+    "threads": None,   # Jumlah thread torch di CPU
+    "conf": 0.25,      # Ambang confidence
+    "iou": 0.7,        # Ambang IoU untuk NMS
+    "classes": None,   # Daftar index kelas yang dideteksi, None = semua kelas
+}
+
+
+class ProfileStore:
+    """
+    Menyimpan profil (capture per perangkat, inferensi per mesin dan model) dalam file JSON.
+    """
+    def __init__(self, path, defaults):
+        self.path = path
+        self.defaults = defaults
+        self.profiles = {}
+        self.load()
+
+    def load(self):
+        """Membaca profil dari disk, file yang rusak atau tidak ada diabaikan."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.profiles = json.load(f)
+        except (OSError, ValueError):
+            self.profiles = {}
+
+    def save(self):
+        """Menulis semua profil ke disk."""
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.profiles, f, indent=2)
+        except OSError as e:
+            print(f"Peringatan: Gagal menyimpan profil ke {os.path.basename(self.path)}: {e}")
+
+    def get(self, key):
+        """Mengambil profil, digabung dengan nilai default."""
+        profile = dict(self.defaults)
+        profile.update(self.profiles.get(key, {}))
+        return profile
+
+    def update(self, key, **values):
+        """Memperbarui sebagian nilai profil lalu menyimpannya."""
+        self.profiles.setdefault(key, {}).update(values)
+        self.save()
+
+
+class ModelCatalog:
+    """
+    Indeks model di direktori 'models' yang disimpan ke disk: hash, nama kelas, tipe task, ukuran input,
+    jumlah parameter dan latensi terakhir. Info model bisa ditampilkan tanpa memuat bobotnya.
+    """
+    MODEL_EXTENSIONS = ('.pt', '.weights')
+    CHUNK_SIZE = 1024 * 1024  # Ukuran potongan saat membaca file untuk hash dan salin
+
+    def __init__(self, model_dir, index_path):
+        self.model_dir = model_dir
+        self.index_path = index_path
+        self.entries = {}  # Nama file -> info model
+        self.lock = threading.Lock()  # Indeks juga diperbarui dari thread latar belakang
+        self.save_lock = threading.Lock()  # Hanya satu save() yang boleh menulis file sementara pada satu waktu
+        self.load()
+
+    def load(self):
+        """Membaca indeks dari disk, file yang rusak atau tidak ada diabaikan."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Menulis indeks ke file sementara lalu menggantinya agar tidak pernah setengah tertulis."""
+        # save() dipanggil dari thread UI dan thread katalog, penulisan dan penggantian file harus berurutan
+        with self.save_lock:
+            with self.lock:
+                data = json.dumps(self.entries, indent=2)
+            temp_path = self.index_path + ".tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(temp_path, self.index_path)
+            except OSError as e:
+                print(f"Peringatan: Gagal menyimpan katalog model: {e}")
+
+    def model_files(self):
+        """Daftar nama file model yang terindeks, terurut."""
+        with self.lock:
+            return sorted(self.entries)
+
+    def get(self, filename):
+        """Salinan info model, atau None jika tidak terindeks."""
+        with self.lock:
+            entry = self.entries.get(filename)
+            return dict(entry) if entry else None
+
+    def scan(self):
+        """
+        Sinkronisasi indeks dengan isi direktori berdasarkan ukuran dan mtime (tanpa membaca isi file).
+        File baru atau berubah ditandai untuk di-hash ulang. Mengembalikan True jika ada perubahan.
+        """
+        found = {}
+        for entry in os.scandir(self.model_dir):
+            if entry.is_file() and entry.name.endswith(self.MODEL_EXTENSIONS):
+                stat = entry.stat()
+                found[entry.name] = (stat.st_size, stat.st_mtime)
+        changed = False
+        with self.lock:
+            for name in list(self.entries):
+                if name not in found:
+                    del self.entries[name]
+                    changed = True
+            for name, (size, mtime) in found.items():
+                entry = self.entries.get(name)
+                if entry and entry.get("size") == size and entry.get("mtime") == mtime:
+                    continue
+                # Info lama disimpan dulu, dibuang nanti jika hash ternyata berbeda
+                self.entries[name] = dict(entry or {}, size=size, mtime=mtime, sha256=None)
+                changed = True
+        if changed:
+            self.save()
+        return changed
+
+    def pending_hashes(self):
+        with self.lock:
+            return [name for name, entry in self.entries.items() if not entry.get("sha256")]
+
+    def pending_metadata(self):
+        with self.lock:
+            return [name for name, entry in self.entries.items()
+                    if entry.get("sha256") and not entry.get("task") and not entry.get("error")]
+
+    def hash_file(self, filename):
+        """
+        Menghitung hash file model secara bertahap lalu mencatatnya di indeks. Mengembalikan None jika
+        file berubah selama di-hash (misalnya masih disalin), file tersebut akan di-hash ulang nanti.
+        """
+        path = os.path.join(self.model_dir, filename)
+        before = os.stat(path)
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        after = os.stat(path)
+        if (before.st_size, before.st_mtime) != (after.st_size, after.st_mtime):
+            return None
+        digest = sha256.hexdigest()
+        self._set_hash(filename, digest, after.st_size, after.st_mtime)
+        return digest
+
+    def sha256(self, filename):
+        """Hash file model. Dihitung langsung jika thread katalog belum sempat menghitungnya."""
+        entry = self.get(filename)
+        if entry and entry.get("sha256"):
+            return entry["sha256"]
+        digest = self.hash_file(filename)
+        if digest is None:
+            raise OSError(f"File model '{filename}' sedang berubah, coba lagi setelah selesai disalin.")
+        return digest
+
+    def import_file(self, source_path, filename):
+        """Menyalin file model ke direktori sambil menghitung hash-nya dalam satu kali baca."""
+        destination_path = os.path.join(self.model_dir, filename)
+        temp_path = destination_path + ".part"
+        sha256 = hashlib.sha256()
+        with open(source_path, "rb") as src, open(temp_path, "wb") as dst:
+            for chunk in iter(lambda: src.read(self.CHUNK_SIZE), b""):
+                sha256.update(chunk)
+                dst.write(chunk)
+        os.replace(temp_path, destination_path)
+        stat = os.stat(destination_path)
+        with self.lock:
+            self.entries[filename] = dict(self.entries.get(filename, {}), size=stat.st_size, mtime=stat.st_mtime)
+        self._set_hash(filename, sha256.hexdigest(), stat.st_size, stat.st_mtime)
+
+    def _set_hash(self, filename, digest, size, mtime):
+        """Mencatat hash hanya jika entri masih menggambarkan file yang sama (ukuran dan mtime) saat di-hash."""
+        with self.lock:
+            entry = self.entries.get(filename)
+            if entry is None or entry.get("size") != size or entry.get("mtime") != mtime:
+                # scan() sudah melihat versi file yang lebih baru, sha256 dibiarkan kosong agar di-hash ulang
+                return
+            if entry.get("hash_of_metadata") != digest:
+                # Isi file berubah, info lama tidak berlaku lagi
+                for key in ("task", "class_names", "imgsz", "parameters", "latency_ms", "error", "hash_of_metadata"):
+                    entry.pop(key, None)
+            entry["sha256"] = digest
+        self.save()
+
+    @staticmethod
+    def describe(model):
+        """Mengambil info dari model YOLO yang sudah dimuat."""
+        train_args = (getattr(model, "ckpt", None) or {}).get("train_args", {})
+        names = model.names
+        return {
+            "task": model.task,
+            "class_names": list(names.values()) if isinstance(names, dict) else list(names),
+            "imgsz": train_args.get("imgsz", DEFAULT_IMGSZ),
+            "parameters": sum(p.numel() for p in model.model.parameters()),
+        }
+
+    def extract_metadata(self, filename):
+        """Memuat model sekali untuk mengisi info-nya. Model yang gagal dimuat ditandai agar tidak dicoba ulang."""
+        try:
+            metadata = self.describe(YOLO(os.path.join(self.model_dir, filename)))
+        except Exception as e:
+            metadata = {"error": str(e)}
+        self.set_metadata(filename, metadata)
+
+    def set_metadata(self, filename, metadata):
+        with self.lock:
+            entry = self.entries.get(filename)
+            if entry is None:
+                return
+            if "task" in metadata:
+                entry.pop("error", None)
+            entry.update(metadata)
+            entry["hash_of_metadata"] = entry.get("sha256")
+        self.save()
+
+    def record_latency(self, filename, latency_ms):
+        """Mencatat latensi inferensi (rata-rata bergerak). Disimpan ke disk saat save() berikutnya."""
+        with self.lock:
+            entry = self.entries.get(filename)
+            if entry is None:
+                return
+            previous = entry.get("latency_ms")
+            entry["latency_ms"] = round(latency_ms if previous is None else 0.9 * previous + 0.1 * latency_ms, 1)
+
+    def summary(self, filename):
+        """Ringkasan satu baris untuk ditampilkan di UI."""
+        entry = self.get(filename)
+        if not entry:
+            return ""
+        if entry.get("error"):
+            return "Info tidak tersedia (model gagal dibaca)"
+        if not entry.get("task"):
+            return "Mengindeks model..."
+        parts = [entry["task"], f"{len(entry['class_names'])} kelas", f"{entry['imgsz']}px",
+                 f"{entry['parameters'] / 1e6:.1f}M param"]
+        if entry.get("latency_ms") is not None:
+            parts.append(f"{entry['latency_ms']:.0f} ms")
+        return "  |  ".join(parts)
+
+
+class InferenceTuner:
+    """
+    Mencari pengaturan inferensi tercepat untuk mesin ini. Model dijalankan pada gambar contoh dengan
+    kombinasi imgsz, half precision dan jumlah thread, lalu hasil deteksinya dibandingkan dengan
+    deteksi referensi pada ukuran input penuh model.
+    """
+    IMGSZ_CANDIDATES = (320, 416, 512, 640, 800, 960, 1280)
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+    MIN_AGREEMENT = 0.9    # Kesesuaian minimal dengan referensi agar pengaturan boleh dipilih
+    MATCH_IOU = 0.5        # IoU minimal agar dua kotak dianggap deteksi yang sama
+    FRAMES_PER_CLIP = 5    # Jumlah frame yang diambil merata dari setiap klip video
+
+    def __init__(self, model, reference_imgsz, conf=0.25, iou=0.7, classes=None):
+        self.model = model
+        self.reference_imgsz = reference_imgsz
+        self.conf = conf
+        self.iou = iou
+        self.classes = classes
+
+    @classmethod
+    def load_samples(cls, sample_dir, clip_paths=()):
+        """Membaca gambar dari sample_dir dan beberapa frame dari setiap klip video (format BGR)."""
+        samples = []
+        if os.path.isdir(sample_dir):
+            for name in sorted(os.listdir(sample_dir)):
+                if name.lower().endswith(cls.IMAGE_EXTENSIONS):
+                    image = cv2.imread(os.path.join(sample_dir, name))
+                    if image is not None:
+                        samples.append(image)
+        for clip_path in clip_paths:
+            capture = cv2.VideoCapture(clip_path)
+            frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            for i in range(cls.FRAMES_PER_CLIP):
+                capture.set(cv2.CAP_PROP_POS_FRAMES, i * frame_count // cls.FRAMES_PER_CLIP)
+                ret, frame = capture.read()
+                if ret:
+                    samples.append(frame)
+            capture.release()
+        return samples
+
+    def candidates(self):
+        """Semua kombinasi (imgsz, half, threads) yang akan diuji."""
+        imgsz_options = [size for size in self.IMGSZ_CANDIDATES if size < self.reference_imgsz] + [self.reference_imgsz]
+        if torch.cuda.is_available():
+            half_options = [False, True]
+            thread_options = [None]  # Jumlah thread torch tidak memengaruhi inferensi di GPU
+        else:
+            half_options = [False]  # FP16 tidak dipakai di CPU
+            cpu_count = os.cpu_count() or 1
+            thread_options = sorted({n for n in (1, 2, 4, cpu_count // 2, cpu_count) if 1 <= n <= cpu_count})
+        return [(imgsz, half, threads) for imgsz in imgsz_options for half in half_options for threads in thread_options]
+
+    def _detect(self, image, imgsz, half):
+        """Menjalankan model dan mengembalikan (kotak xyxy, kelas) sebagai array numpy."""
+        kwargs = {"imgsz": imgsz, "conf": self.conf, "iou": self.iou, "classes": self.classes, "verbose": False}
+        if half:
+            # 'half' hanya dikirim jika True, versi ultralytics terbaru mencetak peringatan deprecated setiap kali dipakai
+            kwargs["half"] = True
+        result = self.model(image, **kwargs)[0]
+        return result.boxes.xyxy.cpu().numpy(), result.boxes.cls.cpu().numpy()
+
+    @classmethod
+    def _agreement(cls, reference, candidate):
+        """Skor F1 antara deteksi referensi dan kandidat (kotak dengan kelas sama dan IoU cukup besar)."""
+        ref_boxes, ref_classes = reference
+        cand_boxes, cand_classes = candidate
+        if len(ref_boxes) == 0 and len(cand_boxes) == 0:
+            return 1.0
+        matched = set()
+        for box, cls_id in zip(ref_boxes, ref_classes):
+            best_iou, best_index = cls.MATCH_IOU, None
+            for j, (other, other_cls) in enumerate(zip(cand_boxes, cand_classes)):
+                if j in matched or other_cls != cls_id:
+                    continue
+                inter_w = max(0.0, min(box[2], other[2]) - max(box[0], other[0]))
+                inter_h = max(0.0, min(box[3], other[3]) - max(box[1], other[1]))
+                inter = inter_w * inter_h
+                union = (box[2] - box[0]) * (box[3] - box[1]) + (other[2] - other[0]) * (other[3] - other[1]) - inter
+                box_iou = inter / union if union > 0 else 0.0
+                if box_iou >= best_iou:
+                    best_iou, best_index = box_iou, j
+            if best_index is not None:
+                matched.add(best_index)
+        return 2 * len(matched) / (len(ref_boxes) + len(cand_boxes))
+
+    def _measure(self, samples, imgsz, half, threads):
+        """Latensi median (ms) dan deteksi untuk setiap sampel dengan satu pengaturan (threads None = tidak diubah)."""
+        if threads:
+            torch.set_num_threads(threads)
+        self._detect(samples[0], imgsz, half)  # Pemanasan, run pertama selalu lebih lambat
+        latencies, detections = [], []
+        for image in samples:
+            start = time.perf_counter()
+            detections.append(self._detect(image, imgsz, half))
+            latencies.append((time.perf_counter() - start) * 1000)
+        return sorted(latencies)[len(latencies) // 2], detections
+
+    def run(self, samples, progress=None, should_stop=None):
+        """
+        Menguji semua kandidat dan mengembalikan profil tercepat yang kesesuaiannya dengan referensi
+        minimal MIN_AGREEMENT. progress(selesai, total) dipanggil setelah setiap kandidat.
+        """
+        original_threads = torch.get_num_threads()
+        candidates = self.candidates()
+        try:
+            reference_latency, reference = self._measure(samples, self.reference_imgsz, False, os.cpu_count() or 1)
+            best = None
+            for done, (imgsz, half, threads) in enumerate(candidates, start=1):
+                if should_stop and should_stop():
+                    return None
+                latency, detections = self._measure(samples, imgsz, half, threads)
+                agreement = sum(self._agreement(r, d) for r, d in zip(reference, detections)) / len(samples)
+                if agreement >= self.MIN_AGREEMENT and (best is None or latency < best["latency_ms"]):
+                    best = {"imgsz": imgsz, "half": half, "threads": threads,
+                            "latency_ms": round(latency, 1), "agreement": round(agreement, 3)}
+                if progress:
+                    progress(done, len(candidates))
+        finally:
+            torch.set_num_threads(original_threads)
+        if best is None:
+            # Tidak ada yang cukup sesuai, gunakan pengaturan referensi
+            best = {"imgsz": self.reference_imgsz, "half": False, "threads": None,
+                    "latency_ms": round(reference_latency, 1), "agreement": 1.0}
+        best.update(conf=self.conf, iou=self.iou, classes=self.classes,
+                    reference_latency_ms=round(reference_latency, 1), date=time.strftime("%Y-%m-%d %H:%M:%S"))
+        return best
+
+
+class ImagePyramid:
+    """
+    Memuat gambar besar tanpa menyimpan piksel resolusi penuh di memori.
+    JPEG didekode langsung pada skala kecil (draft), lalu disimpan beberapa level resolusi untuk tampilan.
+    """
+    TOP_LEVEL_SIDE = 2048  # Sisi terpanjang level tertinggi, sudah lebih besar dari imgsz YOLO
+    MIN_LEVEL_SIDE = 256   # Level terkecil yang masih disimpan
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.full_size = (0, 0)  # Ukuran asli gambar di file
+        self.levels = []         # Dari resolusi tertinggi ke terendah
+        top = self._decode(self.TOP_LEVEL_SIDE)
+        self.levels.append(top)
+        while max(self.levels[-1].size) >= self.MIN_LEVEL_SIDE * 2:
+            self.levels.append(self.levels[-1].reduce(2))
+
+    @property
+    def top(self):
+        return self.levels[0]
+
+    def _decode(self, max_side):
+        """Mendekode gambar dengan sisi terpanjang paling besar max_side."""
+        img = Image.open(self.file_path)
+        self.full_size = img.size
+        scale = max_side / max(img.size)
+        if scale < 1:
+            # draft() membuat dekoder JPEG langsung bekerja di skala 1/2, 1/4 atau 1/8 (format lain diabaikan)
+            img.draft(None, (int(img.width * scale), int(img.height * scale)))
+        # reduce() tidak mendukung mode seperti "P", "1" dan "I;16", ubah ke RGB/RGBA setelah draft
+        if img.mode not in ("RGB", "RGBA", "L"):
+            has_alpha = "A" in img.mode or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        if scale < 1:
+            img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        img.load()
+        return img
+
+    def level_for(self, width, height):
+        """Level terkecil yang masih menutupi area tampilan width x height."""
+        for level in reversed(self.levels):
+            if level.width >= width or level.height >= height:
+                return level
+        return self.top
+
+    def image_for_inference(self, min_side):
+        """
+        Gambar untuk inferensi dengan sisi terpanjang minimal min_side. Jika level tertinggi kurang besar,
+        gambar didekode ulang dari file tanpa disimpan, sehingga pikselnya dilepas setelah inferensi selesai.
+        """
+        if max(self.top.size) >= min_side or self.top.size == self.full_size:
+            return self.top
+        return self._decode(min_side)
+
+
+class DetectionTimeline:
+    """
+    Indeks deteksi per frame untuk file video: jumlah objek dan confidence maksimum per kelas.
+    Disimpan di samping video (<video>.detidx.npz) sehingga membuka ulang video tidak perlu deteksi ulang.
+    """
+    SUFFIX = ".detidx.npz"
+
+    def __init__(self, frames, counts, max_conf, meta):
+        self.frames = frames        # Index frame yang dideteksi, shape (n,)
+        self.counts = counts        # Jumlah objek per kelas, shape (n, jumlah_kelas)
+        self.max_conf = max_conf    # Confidence maksimum per kelas, shape (n, jumlah_kelas)
+        self.meta = meta            # Info video, model dan sampling
+
+    @property
+    def class_names(self):
+        return self.meta["class_names"]
+
+    @classmethod
+    def index_path(cls, video_path):
+        return video_path + cls.SUFFIX
+
+    @staticmethod
+    def _video_signature(video_path):
+        stat = os.stat(video_path)
+        return {"video_size": stat.st_size, "video_mtime": stat.st_mtime}
+
+    @classmethod
+    def load(cls, video_path):
+        """Memuat indeks video, atau None jika belum ada, rusak, atau videonya sudah berubah."""
+        try:
+            with np.load(cls.index_path(video_path)) as data:
+                meta = json.loads(str(data["meta"]))
+                timeline = cls(data["frames"], data["counts"], data["max_conf"], meta)
+            signature = cls._video_signature(video_path)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            # File indeks terpotong atau rusak dianggap belum diindeks, pengguna bisa mengindeks ulang
+            return None
+        if any(meta.get(key) != value for key, value in signature.items()):
+            return None
+        return timeline
+
+    def save(self, video_path):
+        """Menyimpan indeks ke file sementara lalu menggantinya agar tidak pernah setengah tertulis."""
+        path = self.index_path(video_path)
+        temp_path = path[:-len(".npz")] + ".tmp.npz"
+        np.savez_compressed(temp_path, frames=self.frames, counts=self.counts, max_conf=self.max_conf,
+                            meta=np.array(json.dumps(self.meta)))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def build(cls, video_path, model, predict_kwargs, stride=1, progress=None, should_stop=None):
+        """
+        Menjalankan deteksi pada setiap frame ke-stride. Frame di antaranya hanya di-grab (tidak didekode).
+        progress(frame, total_frame) dipanggil berkala. Mengembalikan None jika dibatalkan.
+        """
+        names = model.names
+        class_names = [names[i] for i in range(len(names))] if isinstance(names, dict) else list(names)
+        capture = cv2.VideoCapture(video_path)
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        frames, counts, max_conf = [], [], []
+        index = 0
+        try:
+            while True:
+                if should_stop and should_stop():
+                    return None
+                if index % stride:
+                    if not capture.grab():
+                        break
+                    index += 1
+                    continue
+                ret, frame = capture.read()
+                if not ret:
+                    break
+                boxes = model(frame, **predict_kwargs)[0].boxes
+                classes = boxes.cls.cpu().numpy().astype(int)
+                row_counts = np.zeros(len(class_names), dtype=np.uint16)
+                row_conf = np.zeros(len(class_names), dtype=np.float32)
+                np.add.at(row_counts, classes, 1)
+                np.maximum.at(row_conf, classes, boxes.conf.cpu().numpy())
+                frames.append(index)
+                counts.append(row_counts)
+                max_conf.append(row_conf)
+                if progress and len(frames) % 10 == 0:
+                    progress(index, frame_count)
+                index += 1
+        finally:
+            capture.release()
+        meta = dict(cls._video_signature(video_path), fps=fps, frame_count=index, stride=stride,
+                    class_names=class_names, date=time.strftime("%Y-%m-%d %H:%M:%S"))
+        shape = (0, len(class_names))
+        return cls(np.array(frames, dtype=np.int32),
+                   np.array(counts, dtype=np.uint16).reshape(-1, len(class_names)) if counts else np.zeros(shape, np.uint16),
+                   np.array(max_conf, dtype=np.float16).reshape(-1, len(class_names)) if max_conf else np.zeros(shape, np.float16),
+                   meta)
+
+    def scores(self, class_index=None):
+        """Confidence maksimum per frame untuk satu kelas, atau untuk semua kelas jika class_index None."""
+        if class_index is not None:
+            return self.max_conf[:, class_index].astype(np.float32)
+        if self.max_conf.shape[1] == 0:
+            return np.zeros(len(self.frames), dtype=np.float32)
+        return self.max_conf.max(axis=1).astype(np.float32)
+
+    def heat_row(self, width, class_index, threshold, base_rgb, hot_rgb):
+        """
+        Satu baris piksel (width x 3) untuk strip timeline. Setiap kolom berisi skor maksimum frame di
+        dalamnya; kolom yang lolos threshold diberi warna penuh, sisanya redup sesuai skornya.
+        """
+        columns = np.zeros(width, dtype=np.float32)
+        if len(self.frames):
+            x = np.minimum(self.frames.astype(np.int64) * width // max(self.meta["frame_count"], 1), width - 1)
+            np.maximum.at(columns, x, self.scores(class_index))
+        weight = np.where(columns >= threshold, 1.0, columns * 0.35)[:, None]
+        base = np.array(base_rgb, dtype=np.float32)
+        hot = np.array(hot_rgb, dtype=np.float32)
+        return (base + (hot - base) * weight).astype(np.uint8)
+
+    def find_match(self, position, class_index, threshold, forward=True):
+        """
+        Frame awal dari segmen berikutnya (atau sebelumnya) yang skornya lolos threshold.
+        Mundur melewati segmen yang baru saja dimulai (kurang dari 1 detik) agar bisa terus melompat ke belakang.
+        """
+        if not len(self.frames):
+            return None
+        match = self.scores(class_index) >= threshold
+        segment_starts = self.frames[match & ~np.concatenate(([False], match[:-1]))]
+        if forward:
+            candidates = segment_starts[segment_starts > position]
+            return int(candidates[0]) if len(candidates) else None
+        candidates = segment_starts[segment_starts < position - self.meta["fps"]]
+        return int(candidates[-1]) if len(candidates) else None
+
+
+class LowLatencyCapture:
+    """
+    Pembungkus cv2.VideoCapture yang menerapkan profil capture.
+    Untuk kamera, frame yang tertahan di buffer dibuang (grab/retrieve) agar yang dibaca selalu frame terbaru.
+    Juga mengukur FPS capture dan latensi dari frame diambil sampai tampil di layar.
+    """
+    BACKENDS = {
+        "auto": cv2.CAP_ANY,
+        "v4l2": cv2.CAP_V4L2,
+        "ffmpeg": cv2.CAP_FFMPEG,
+        "dshow": cv2.CAP_DSHOW,
+        "msmf": cv2.CAP_MSMF,
+    }
+    MAX_DRAIN = 4  # Batas frame basi yang dibuang dalam satu kali baca
+
+    def __init__(self, source, profile=None):
+        self.source = source
+        self.profile = dict(DEFAULT_CAPTURE_PROFILE)
+        self.profile.update(profile or {})
+        self.is_live = isinstance(source, int)  # Index kamera = sumber live
+        self.capture = None
+        self.native_fps = 0.0
+        self.frame_count = 0    # Jumlah frame (hanya untuk file video)
+        self.position = -1      # Index frame terakhir yang dibaca (hanya untuk file video)
+        self.negotiated = {}  # Pengaturan yang benar-benar diterima oleh kamera
+        self._grab_times = deque(maxlen=120)  # Setiap grab() yang berhasil, termasuk frame yang dibuang
+        self._read_times = deque(maxlen=60)   # Setiap frame yang benar-benar dikembalikan oleh read()
+        self._latencies_ms = deque(maxlen=60)
+        self._sim_start = None
+        self._sim_frame = 0
+
+    @property
+    def paces_itself(self):
+        """True jika read() sudah mengikuti waktu nyata sehingga loop tidak perlu sleep."""
+        return self.is_live or self.profile.get("simulate_live")
+
+    def open(self):
+        """Membuka sumber video dengan backend dari profil, fallback ke backend otomatis."""
+        backend = self.BACKENDS.get(self.profile.get("backend"), cv2.CAP_ANY)
+        self.capture = cv2.VideoCapture(self.source, backend)
+        if not self.capture.isOpened() and backend != cv2.CAP_ANY:
+            self.capture = cv2.VideoCapture(self.source)
+        if not self.capture.isOpened():
+            return False
+        if self.is_live:
+            self._apply_camera_settings()
+        self.native_fps = self.capture.get(cv2.CAP_PROP_FPS) or 0.0
+        if not self.is_live:
+            self.frame_count = int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        return True
+
+    def _apply_camera_settings(self):
+        """Negosiasi FOURCC, resolusi, FPS dan ukuran buffer dengan kamera."""
+        p = self.profile
+        # FOURCC harus diatur sebelum resolusi, beberapa driver menolak resolusi tinggi tanpa MJPG
+        if p.get("fourcc"):
+            self.capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*p["fourcc"]))
+        if p.get("width") and p.get("height"):
+            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, p["width"])
+            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, p["height"])
+        if p.get("fps"):
+            self.capture.set(cv2.CAP_PROP_FPS, p["fps"])
+        if p.get("buffer_size"):
+            self.capture.set(cv2.CAP_PROP_BUFFERSIZE, p["buffer_size"])
+
+        fourcc_code = int(self.capture.get(cv2.CAP_PROP_FOURCC))
+        self.negotiated = {
+            "width": int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fourcc": "".join(chr((fourcc_code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00 "),
+            "fps": self.capture.get(cv2.CAP_PROP_FPS),
+        }
+
+    def isOpened(self):
+        return self.capture is not None and self.capture.isOpened()
+
+    def read(self):
+        """
+        Mengambil satu frame. Mengembalikan (ret, frame, frame_time), frame_time adalah
+        waktu perf_counter saat frame diambil dari perangkat.
+        """
+        if self.is_live:
+            ok = self._grab_latest()
+        elif self.profile.get("simulate_live"):
+            ok = self._grab_realtime()
+        else:
+            ok = self._grab()
+        if not ok:
+            return False, None, None
+        frame_time = time.perf_counter()
+        self._read_times.append(frame_time)
+        if not self.is_live:
+            self.position = int(self.capture.get(cv2.CAP_PROP_POS_FRAMES)) - 1
+        ret, frame = self.capture.retrieve()
+        return ret, frame, frame_time
+
+    def seek(self, frame_index):
+        """Melompat ke frame tertentu pada file video."""
+        self.capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        self.position = frame_index - 1
+        # Jam waktu nyata untuk video pengganti kamera dimulai ulang dari posisi baru
+        self._sim_start = None
+        self._sim_frame = 0
+
+    def _grab(self):
+        """grab() yang dicatat waktunya, dipakai untuk menghitung FPS capture."""
+        ok = self.capture.grab()
+        if ok:
+            self._grab_times.append(time.perf_counter())
+        return ok
+
+    def _grab_latest(self):
+        """
+        Membuang frame basi di buffer kamera. grab() yang kembali sangat cepat berarti
+        frame sudah lama menunggu di buffer, grab() yang harus menunggu berarti frame baru.
+        """
+        stale_threshold = 0.5 / (self.native_fps or 30)
+        for _ in range(self.MAX_DRAIN):
+            start = time.perf_counter()
+            if not self._grab():
+                return False
+            if time.perf_counter() - start > stale_threshold:
+                break
+        return True
+
+    def _grab_realtime(self):
+        """Meniru kamera dengan file video: melewati frame yang sudah terlambat sesuai waktu nyata."""
+        fps = self.native_fps or 30
+        now = time.perf_counter()
+        if self._sim_start is None:
+            self._sim_start = now
+        due_frame = int((now - self._sim_start) * fps)
+        if due_frame < self._sim_frame:
+            # Lebih cepat dari waktu nyata, tunggu tepat sampai waktu frame berikutnya "tiba"
+            time.sleep(max(0.0, self._sim_frame / fps - (now - self._sim_start)))
+        while self._sim_frame < due_frame:
+            if not self._grab():
+                return False
+            self._sim_frame += 1
+        self._sim_frame += 1
+        return self._grab()
+
+    def record_display(self, frame_time):
+        """Mencatat latensi dari frame diambil sampai selesai digambar di canvas."""
+        self._latencies_ms.append((time.perf_counter() - frame_time) * 1000)
+
+    @staticmethod
+    def _rate(times):
+        if len(times) < 2:
+            return 0.0
+        span = times[-1] - times[0]
+        return (len(times) - 1) / span if span > 0 else 0.0
+
+    def capture_fps(self):
+        """
+        FPS frame yang diterima dari sumber (semua grab(), termasuk frame basi yang dibuang).
+        Frame yang sudah ditimpa driver karena buffer penuh tidak terlihat sehingga tidak ikut terhitung.
+        """
+        return self._rate(self._grab_times)
+
+    def processed_fps(self):
+        """FPS frame yang benar-benar diproses loop video (ikut melambat saat inferensi berjalan)."""
+        return self._rate(self._read_times)
+
+    def mean_latency_ms(self):
+        """Rata-rata latensi capture-ke-tampilan dalam milidetik."""
+        if not self._latencies_ms:
+            return 0.0
+        return sum(self._latencies_ms) / len(self._latencies_ms)
+
+    def release(self):
+        if self.capture:
+            self.capture.release()
+
 
 # --- Kelas Utama Aplikasi ---
 class GUIDetectorApp:
@@ -48,6 +806,12 @@ class GUIDetectorApp:
 
     base_dir = os.path.dirname(os.path.abspath(__file__))
     MODEL_DIR = os.path.join(base_dir, "models")  # Nama direktori untuk menyimpan model YOLO
+    CAPTURE_PROFILE_FILE = os.path.join(base_dir, "capture_profiles.json")  # Profil capture per perangkat
+    MODEL_CATALOG_FILE = os.path.join(MODEL_DIR, "catalog.json")  # Indeks info model
+    MODEL_DIR_POLL_MS = 3000  # Interval pengecekan perubahan di direktori model
+    INFERENCE_PROFILE_FILE = os.path.join(base_dir, "inference_profiles.json")  # Profil inferensi per mesin dan model
+    SAMPLE_IMAGE_DIR = os.path.join(base_dir, "sample_image")  # Gambar contoh untuk tuning inferensi
+    INDEX_SAMPLE_RATES = {"Setiap frame": None, "5 per detik": 5, "2 per detik": 2, "1 per detik": 1}  # Sampling indeks video
 
     # --- Metode Inisialisasi (`__init__`) ---
     def __init__(self, root):
@@ -70,8 +834,22 @@ class GUIDetectorApp:
         self.image_tk = None            # menyimpan gambar yang siap ditampilkan di Tkinter
         self.is_predicting = False      # Status apakah prediksi sedang berjalan (True/False)
         self.current_media_type = None  # Menyimpan tipe media saat ini ('image', 'video', 'camera')
-        self.original_pil_image = None  # menyimpan gambar asli
+        self.original_pil_image = None  # menyimpan gambar asli (level tertinggi dari image_pyramid)
+        self.image_pyramid = None       # menyimpan level-level resolusi gambar untuk tampilan
         self.model = None               # menyimpan objek model YOLO
+        self.model_name = None          # nama file model yang sedang dimuat
+        self.inference_profiles = ProfileStore(self.INFERENCE_PROFILE_FILE, DEFAULT_INFERENCE_PROFILE)
+        self.inference_profile = dict(DEFAULT_INFERENCE_PROFILE)  # Profil inferensi untuk model yang sedang dimuat
+        self.default_torch_threads = torch.get_num_threads()      # Dipakai kembali jika profil tidak mengatur thread
+        self.is_camera_on = False       # Status apakah kamera sedang dibuka
+        self.video_source_key = None    # Kunci profil capture kamera yang sedang berjalan (None untuk file video)
+        self.video_path = None          # Path file video yang sedang dibuka
+        self.pending_seek = None        # Index frame tujuan lompatan, diproses oleh thread video
+
+        # --- Variabel untuk Capture Kamera ---
+        self.capture_profiles = ProfileStore(self.CAPTURE_PROFILE_FILE, DEFAULT_CAPTURE_PROFILE)
+        self.camera_index = 0           # Index kamera yang dibuka oleh tombol 'Buka Kamera'
+        self.camera_stand_in = None     # File video pengganti kamera (untuk pengujian tanpa kamera)
         
         # --- Variabel untuk Logging ---
         # List ini akan menyimpan semua riwayat aktivitas aplikasi.
@@ -81,8 +859,16 @@ class GUIDetectorApp:
         self.video_thread = None  # Akan menyimpan objek thread video
         self.stop_thread = threading.Event()  # Objek untuk memberi sinyal kapan thread harus berhenti
 
+        # --- Variabel untuk Indeks Deteksi Video ---
+        self.timeline = None               # DetectionTimeline untuk video yang sedang dibuka
+        self.index_thread = None           # Thread yang mengindeks video di latar belakang
+        self.index_retry = None            # Jadwal root.after saat menunggu pengindeksan sebelumnya berhenti
+        self.index_stop = threading.Event()
+
         # --- Setup Awal ---
         self._setup_model_directory()  # Memastikan direktori model ada
+        self.model_catalog = ModelCatalog(self.MODEL_DIR, self.MODEL_CATALOG_FILE)
+        self.catalog_thread = None  # Thread yang menghitung hash dan info model di latar belakang
         self._configure_styles()  # Mengatur gaya visual untuk widget ttk
 
         # --- Konfigurasi Grid Layout Utama ---
@@ -97,7 +883,7 @@ class GUIDetectorApp:
         self._create_right_panel()
         
         # --- Inisialisasi Akhir ---
-        self._load_existing_models()  # Memuat model yang sudah tersimpan
+        self._scan_model_directory()  # Memuat model yang sudah tersimpan
         self._reset_ui_state()  # Mengatur state awal tombol-tombol
 
         # Menangani event penutupan jendela untuk cleanup yang aman
@@ -156,8 +942,16 @@ class GUIDetectorApp:
         ttk.Label(left_frame, text="SUMBER MEDIA", style='Header.TLabel').pack(pady=(30, 15), anchor="w")
         ttk.Button(left_frame, text="🎬  Unggah Gambar", command=self._select_image).pack(fill="x", pady=5)
         ttk.Button(left_frame, text="📹  Unggah Video", command=self._select_video).pack(fill="x", pady=5)
-        self.camera_button = ttk.Button(left_frame, text="📷  Buka Kamera", command=self._open_camera)
-        self.camera_button.pack(fill="x", pady=5)
+
+        # --- Frame untuk menampung tombol Buka Kamera dan Pengaturan Kamera ---
+        camera_button_frame = ttk.Frame(left_frame)
+        camera_button_frame.pack(fill="x", pady=5)
+        camera_button_frame.columnconfigure(0, weight=1)
+        camera_button_frame.columnconfigure(1, weight=0)
+        self.camera_button = ttk.Button(camera_button_frame, text="📷  Buka Kamera", command=self._open_camera)
+        self.camera_button.grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        camera_settings_button = ttk.Button(camera_button_frame, text="⚙️", command=self._open_capture_settings_window, width=3)
+        camera_settings_button.grid(row=0, column=1, sticky="e")
         self.close_camera_button = ttk.Button(left_frame, text="📷  Tutup Kamera", command=self._close_camera)
         self.close_camera_button.pack(fill="x", pady=5)
         ttk.Button(left_frame, text="❌  Clear Media", command=self._clear_media).pack(fill="x", pady=(15,5))
@@ -165,6 +959,9 @@ class GUIDetectorApp:
         ttk.Label(left_frame, text="MODEL ANALISIS", style='Header.TLabel').pack(pady=(30, 15), anchor="w")
         self.model_combobox = ttk.Combobox(left_frame, state="readonly")
         self.model_combobox.pack(fill="x", pady=5)
+        self.model_combobox.bind("<<ComboboxSelected>>", lambda e: self._update_model_info())
+        self.model_info_label = ttk.Label(left_frame, text="", font=self.FONT_SMALL, foreground=self.COLOR_DISABLED_TEXT, wraplength=240)
+        self.model_info_label.pack(fill="x")
 
         # --- Frame untuk menampung tombol Unggah dan Pengaturan Model ---
         model_button_frame = ttk.Frame(left_frame)
@@ -181,6 +978,9 @@ class GUIDetectorApp:
         settings_button = ttk.Button(model_button_frame, text="⚙️", command=self._open_manage_models_window, width=3)
         settings_button.grid(row=0, column=1, sticky="e")
 
+        # Tombol Tuning, mencari pengaturan inferensi tercepat untuk mesin ini
+        ttk.Button(left_frame, text="⏱  Tuning Inferensi...", command=self._open_tuner_window).pack(fill="x", pady=5)
+
     def _create_center_panel(self):
         """Membuat panel tengah untuk menampilkan gambar atau video."""
         center_frame = ttk.Frame(self.root, padding=0)
@@ -196,6 +996,43 @@ class GUIDetectorApp:
             font=("Segoe UI", 16, "italic"), fill="#555")
         self.frame_sketch.bind("<Configure>", self._center_frame_sketch_content)
 
+        self._create_timeline_panel(center_frame)
+
+        # Label kecil untuk menampilkan FPS capture dan latensi saat video/kamera berjalan
+        self.capture_stats_label = ttk.Label(center_frame, text="", font=self.FONT_SMALL, foreground=self.COLOR_DISABLED_TEXT)
+        self.capture_stats_label.grid(row=2, column=0, sticky="e", padx=10, pady=(2, 0))
+
+    def _create_timeline_panel(self, parent):
+        """Membuat strip timeline deteksi dan kontrol pencarian untuk file video (disembunyikan untuk media lain)."""
+        self.timeline_frame = ttk.Frame(parent, padding=(10, 8))
+        self.timeline_frame.grid(row=1, column=0, sticky="ew", pady=(5, 0))
+        self.timeline_frame.columnconfigure(6, weight=1)
+
+        self.timeline_canvas = tk.Canvas(self.timeline_frame, height=28, bg=self.COLOR_BACKGROUND, highlightthickness=0, cursor="hand2")
+        self.timeline_canvas.grid(row=0, column=0, columnspan=7, sticky="ew", pady=(0, 8))
+        self.timeline_canvas.bind("<Configure>", lambda e: self._draw_timeline())
+        self.timeline_canvas.bind("<Button-1>", self._on_timeline_click)
+        self.timeline_canvas.bind("<B1-Motion>", self._on_timeline_click)
+
+        self.index_button = ttk.Button(self.timeline_frame, text="Indeks Video", command=self._start_video_indexing)
+        self.index_button.grid(row=1, column=0, padx=(0, 5))
+        self.index_rate_combobox = ttk.Combobox(self.timeline_frame, state="readonly", width=12,
+                                                values=list(self.INDEX_SAMPLE_RATES))
+        self.index_rate_combobox.set("2 per detik")
+        self.index_rate_combobox.grid(row=1, column=1, padx=(0, 15))
+        self.timeline_class_combobox = ttk.Combobox(self.timeline_frame, state="readonly", width=16, values=["Semua Kelas"])
+        self.timeline_class_combobox.set("Semua Kelas")
+        self.timeline_class_combobox.grid(row=1, column=2, padx=(0, 5))
+        self.timeline_class_combobox.bind("<<ComboboxSelected>>", lambda e: self._draw_timeline())
+        self.timeline_threshold_var = tk.StringVar(value="0.5")
+        ttk.Spinbox(self.timeline_frame, from_=0.05, to=0.95, increment=0.05, width=5, textvariable=self.timeline_threshold_var,
+                    command=self._draw_timeline).grid(row=1, column=3, padx=(0, 5))
+        ttk.Button(self.timeline_frame, text="◀", width=3, command=lambda: self._jump_to_match(forward=False)).grid(row=1, column=4)
+        ttk.Button(self.timeline_frame, text="▶", width=3, command=lambda: self._jump_to_match(forward=True)).grid(row=1, column=5, padx=(5, 0))
+        self.timeline_status_label = ttk.Label(self.timeline_frame, text="", font=self.FONT_SMALL, foreground=self.COLOR_DISABLED_TEXT)
+        self.timeline_status_label.grid(row=1, column=6, sticky="e")
+        self.timeline_frame.grid_remove()
+
     def _create_right_panel(self):
         """Membuat panel kanan untuk menampilkan hasil deteksi dan tombol tambahan."""
         right_frame = ttk.Frame(self.root, padding=(20, 25, 15, 25))
@@ -245,9 +1082,11 @@ class GUIDetectorApp:
         if self.video_thread and self.video_thread.is_alive():
             self.video_thread.join(timeout=0.5)
         if self.video_capture:
+            self._store_capture_measurements()
             self.video_capture.release()
             self.video_capture = None
         self.is_camera_on = False
+        self.capture_stats_label.config(text="")
 
     def _reset_ui_state(self):
         """Mengatur ulang state semua tombol dan tabel ke kondisi awal."""
@@ -264,7 +1103,10 @@ class GUIDetectorApp:
         if self.current_media_type in ['image', 'video']:
             self._add_log(f"Media '{self.current_media_type}' dibersihkan.")
             self._stop_current_feed()
+            self._close_timeline()
             self.current_media_type = None
+            self.original_pil_image = None
+            self.image_pyramid = None
             self.frame_sketch.delete("all")
             self.image_tk = None
             self.frame_sketch_text = self.frame_sketch.create_text(
@@ -279,24 +1121,49 @@ class GUIDetectorApp:
         if not file_path:
             self._add_log("Pemilihan gambar dibatalkan.")
             return
-        self._add_log(f"Gambar dipilih: {os.path.basename(file_path)}")
+        try:
+            pyramid = ImagePyramid(file_path)
+        except Exception as e:
+            self._add_log(f"Gagal membuka gambar: {e}")
+            messagebox.showerror("Gagal Membuka Gambar", f"Gambar tidak dapat dibuka:\n{e}")
+            return
+        width, height = pyramid.full_size
+        self._add_log(f"Gambar dipilih: {os.path.basename(file_path)} ({width}x{height})")
         self._stop_current_feed()
+        self._close_timeline()
         self.current_media_type = 'image'
         self.start_predict_button.config(text="▶  Start Predict")
         self._reset_ui_state()
-        img = Image.open(file_path)
-        self.original_pil_image = img.copy()
-        self._display_image(img)
+        self.image_pyramid = pyramid
+        self.original_pil_image = pyramid.top
+        self._display_image(self.original_pil_image)
+
+    def _capture_profile_key(self, camera_index):
+        """Membuat kunci profil capture untuk kamera: 'camera:<index>'."""
+        return f"camera:{camera_index}"
 
-    def _start_video_stream(self, source):
+    def _start_video_stream(self, source, profile_overrides=None):
         """Memulai stream video (dari file atau kamera) di thread terpisah."""
         self._stop_current_feed()
-        self.video_capture = cv2.VideoCapture(source)
-        if not self.video_capture.isOpened():
+        # Profil capture hanya disimpan untuk kamera asli, file video (termasuk video pengganti) memakai default
+        if isinstance(source, int):
+            self.video_source_key = self._capture_profile_key(source)
+            profile = self.capture_profiles.get(self.video_source_key)
+        else:
+            self.video_source_key = None
+            profile = dict(DEFAULT_CAPTURE_PROFILE)
+        profile.update(profile_overrides or {})
+        self.video_capture = LowLatencyCapture(source, profile)
+        if not self.video_capture.open():
             print(f"Error: Tidak dapat membuka sumber video: {source}")
+            self._add_log(f"Gagal membuka sumber video: {source}")
+            self.video_capture = None
             self._close_camera()
             return
-        fps = self.video_capture.get(cv2.CAP_PROP_FPS)
+        if self.video_capture.negotiated:
+            n = self.video_capture.negotiated
+            self._add_log(f"Kamera aktif: {n['width']}x{n['height']} {n['fourcc'] or '-'} @ {n['fps']:.0f} FPS")
+        fps = self.video_capture.native_fps
         self.frame_delay_sec = 1 / fps if fps > 0 else 1 / 30
         self.stop_thread.clear()
         self.video_thread = threading.Thread(target=self._video_loop, daemon=True)
@@ -310,9 +1177,13 @@ class GUIDetectorApp:
             return
         self._add_log(f"Video dipilih: {os.path.basename(file_path)}")
         self.current_media_type = 'video'
+        self.original_pil_image = None
+        self.image_pyramid = None
         self.start_predict_button.config(text="▶  Start Continue Predict")
         self._reset_ui_state()
         self._start_video_stream(file_path)
+        if self.video_capture:
+            self._open_timeline(file_path)
 
     def _open_camera(self):
         """Fungsi khusus untuk membuka kamera."""
@@ -320,12 +1191,20 @@ class GUIDetectorApp:
         self.is_camera_on = True
         self.camera_button.config(state="disabled")
         self.close_camera_button.config(state="normal")
+        self._close_timeline()
         self.current_media_type = 'camera'
+        self.original_pil_image = None
+        self.image_pyramid = None
         self.start_predict_button.config(text="▶  Start Continue Predict")
         self._reset_ui_state()
         self.camera_button.config(state="disabled")
         self.close_camera_button.config(state="normal")
-        self._start_video_stream(0)
+        if self.camera_stand_in:
+            # File video dipakai sebagai pengganti kamera, diputar mengikuti waktu nyata
+            self._add_log(f"Menggunakan video pengganti kamera: {os.path.basename(self.camera_stand_in)}")
+            self._start_video_stream(self.camera_stand_in, {"simulate_live": True})
+        else:
+            self._start_video_stream(self.camera_index)
 
     def _close_camera(self):
         """Fungsi khusus untuk menutup kamera dan membersihkan frame_sketch."""
@@ -342,13 +1221,25 @@ class GUIDetectorApp:
 
     def _video_loop(self):
         """Loop yang berjalan di thread terpisah untuk terus memproses frame video."""
+        last_stats_update = time.perf_counter()
+        finished = False  # File video sudah habis, menunggu lompatan dari timeline
         while not self.stop_thread.is_set():
-            if self.video_capture and self.video_capture.isOpened():
-                ret, frame = self.video_capture.read()
+            capture = self.video_capture
+            if capture and capture.isOpened():
+                if self.pending_seek is not None:
+                    capture.seek(self.pending_seek)
+                    self.pending_seek = None
+                    finished = False
+                if finished:
+                    time.sleep(self.frame_delay_sec)
+                    continue
+                ret, frame, frame_time = capture.read()
                 if ret:
                     display_frame = frame
                     if self.is_predicting and self.model:
-                        results = self.model(frame, verbose=False)[0]
+                        inference_start = time.perf_counter()
+                        results = self._predict(frame)
+                        self.model_catalog.record_latency(self.model_name, (time.perf_counter() - inference_start) * 1000)
                         display_frame = results.plot()
                         object_counts = {}
                         for box in results.boxes:
@@ -357,12 +1248,47 @@ class GUIDetectorApp:
                         self.root.after(0, self._update_results_table, object_counts)
                     frame_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
                     img = Image.fromarray(frame_rgb)
-                    self.root.after(0, self._display_image, img)
+                    self.root.after(0, self._display_image, img, frame_time)
+                    if not capture.is_live:
+                        self.root.after(0, self._update_timeline_playhead, capture.position)
+                    if frame_time - last_stats_update >= 1.0:
+                        last_stats_update = frame_time
+                        self.root.after(0, self._update_capture_stats)
+                elif self.current_media_type == 'video':
+                    # Frame terakhir tetap ditampilkan agar pengguna bisa melompat lewat timeline
+                    finished = True
+                    continue
                 else:
                     self.root.after(0, self._close_camera if self.is_camera_on else self._clear_media)
                     break
+                # Kamera dan video pengganti sudah mengikuti waktu nyata di read(), sleep hanya menambah latensi
+                if capture.paces_itself:
+                    continue
             time.sleep(self.frame_delay_sec)
 
+    def _update_capture_stats(self):
+        """Menampilkan FPS capture, FPS yang diproses dan latensi capture-ke-tampilan di bawah canvas."""
+        capture = self.video_capture
+        if not capture:
+            return
+        self.capture_stats_label.config(
+            text=f"Capture {capture.capture_fps():.1f} FPS  |  Diproses {capture.processed_fps():.1f} FPS  |  "
+                 f"Latensi {capture.mean_latency_ms():.0f} ms")
+
+    def _store_capture_measurements(self):
+        """Menyimpan hasil pengukuran terakhir ke profil kamera yang sedang berjalan."""
+        capture = self.video_capture
+        # Angka dari file video atau video pengganti tidak boleh menimpa pengukuran kamera asli
+        if not capture.is_live or not self.video_source_key or capture.capture_fps() <= 0:
+            return
+        self.capture_profiles.update(self.video_source_key, last_measured={
+            "fps": round(capture.capture_fps(), 1),
+            "processed_fps": round(capture.processed_fps(), 1),
+            "latency_ms": round(capture.mean_latency_ms(), 1),
+            "negotiated": capture.negotiated,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        })
+
     def _load_yolo_model(self):
         """Memuat model YOLO yang dipilih dari combobox."""
         selected_model_file = self.model_combobox.get()
@@ -378,23 +1304,71 @@ class GUIDetectorApp:
             self.root.config(cursor="watch")
             self.root.update()
             self.model = YOLO(model_path)
+            self.model_name = selected_model_file
+            # Model sudah dimuat, sekalian isi info katalog jika belum ada
+            entry = self.model_catalog.get(selected_model_file)
+            if entry and entry.get("sha256") and not entry.get("task"):
+                self.model_catalog.set_metadata(selected_model_file, ModelCatalog.describe(self.model))
             self._add_log("Model berhasil dimuat.")
+            self._apply_inference_profile(selected_model_file)
             return True
         except Exception as e:
             self._add_log(f"Gagal memuat model: {e}")
             messagebox.showerror("Gagal Memuat Model", f"Terjadi kesalahan saat memuat model:\n{e}")
             self.model = None
+            self.model_name = None
             return False
         finally:
             self.root.config(cursor="")
             self.root.update()
 
+    def _model_imgsz(self, filename):
+        """Ukuran input model dari katalog, atau ukuran bawaan jika belum diketahui."""
+        imgsz = (self.model_catalog.get(filename) or {}).get("imgsz") or DEFAULT_IMGSZ
+        return max(imgsz) if isinstance(imgsz, (list, tuple)) else int(imgsz)
+
+    def _inference_profile_key(self, filename):
+        """
+        Kunci profil inferensi: nama mesin dan hash model. Selalu memakai hash (bukan nama file) agar profil
+        tidak hilang saat hash selesai dihitung. Bisa melempar OSError jika file model tidak bisa dibaca.
+        """
+        return f"{platform.node()}|{self.model_catalog.sha256(filename)}"
+
+    def _apply_inference_profile(self, filename, profile_key=None):
+        """Memuat profil inferensi untuk model ini di mesin ini dan menerapkan jumlah thread torch."""
+        self.inference_profile = self.inference_profiles.get(profile_key or self._inference_profile_key(filename))
+        torch.set_num_threads(self.inference_profile["threads"] or self.default_torch_threads)
+        if "date" in self.inference_profile:
+            p = self.inference_profile
+            self._add_log(f"Profil inferensi dipakai: imgsz {p['imgsz']}, half {p['half']}, {p['threads'] or 'default'} thread.")
+
+    @staticmethod
+    def _inference_kwargs(profile):
+        """Argumen pemanggilan model YOLO dari sebuah profil inferensi."""
+        kwargs = {"conf": profile["conf"], "iou": profile["iou"], "verbose": False}
+        if profile["imgsz"]:
+            kwargs["imgsz"] = profile["imgsz"]
+        if profile["half"]:
+            kwargs["half"] = True
+        if profile["classes"]:
+            kwargs["classes"] = profile["classes"]
+        return kwargs
+
+    def _predict(self, source):
+        """Menjalankan model dengan pengaturan dari profil inferensi."""
+        return self.model(source, **self._inference_kwargs(self.inference_profile))[0]
+
     def _run_yolo_on_image(self):
         """Menjalankan deteksi pada gambar statis dan menampilkan hasilnya."""
         if not self.model or not self.original_pil_image:
             self._stop_prediction()
             return
-        results = self.model(self.original_pil_image, verbose=False)[0]
+        # Level pyramid sudah cukup besar untuk imgsz model, gambar resolusi penuh tidak perlu didekode
+        imgsz = self.inference_profile["imgsz"] or self._model_imgsz(self.model_name)
+        inference_image = self.image_pyramid.image_for_inference(imgsz)
+        inference_start = time.perf_counter()
+        results = self._predict(inference_image)
+        self.model_catalog.record_latency(self.model_name, (time.perf_counter() - inference_start) * 1000)
         processed_image_bgr = results.plot()
         object_counts = {}
         for box in results.boxes:
@@ -426,13 +1400,17 @@ class GUIDetectorApp:
         self.is_predicting = False
         self.start_predict_button.config(state="normal")
         self.stop_predict_button.config(state="disabled")
+        self.model_catalog.save()  # Menyimpan latensi terakhir yang terukur
+        self._update_model_info()
 
-    def _display_image(self, img):
+    def _display_image(self, img, frame_time=None):
         """Mengubah ukuran gambar dan menampilkannya di frame_sketch."""
         if not self.current_media_type: return
         frame_sketch_width = self.frame_sketch.winfo_width()
         frame_sketch_height = self.frame_sketch.winfo_height()
         if frame_sketch_width <= 1 or frame_sketch_height <= 1: return
+        if self.image_pyramid and img is self.image_pyramid.top:
+            img = self.image_pyramid.level_for(frame_sketch_width, frame_sketch_height)
         img_ratio = img.width / img.height
         frame_sketch_ratio = frame_sketch_width / frame_sketch_height
         if frame_sketch_ratio > img_ratio:
@@ -441,24 +1419,76 @@ class GUIDetectorApp:
         else:
             new_width = frame_sketch_width
             new_height = int(new_width / img_ratio)
-        resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
         self.image_tk = ImageTk.PhotoImage(resized_img)
         self.frame_sketch.delete("all")
         self.frame_sketch.create_image(frame_sketch_width / 2, frame_sketch_height / 2, image=self.image_tk, anchor="center", tags="image")
+        if frame_time is not None and self.video_capture:
+            self.video_capture.record_display(frame_time)
 
     def _load_existing_models(self):
-        """Memuat daftar model dari direktori 'models'."""
-        try:
-            model_files = [f for f in os.listdir(self.MODEL_DIR) if f.endswith(('.pt', '.weights'))]
-            if not model_files:
-                self.model_combobox['values'] = ["Model Belum Ditemukan"]
-                self.model_combobox.set("Model Belum Ditemukan")
+        """Memuat daftar model dari katalog model."""
+        model_files = self.model_catalog.model_files()
+        if not model_files:
+            self.model_combobox['values'] = ["Model Belum Ditemukan"]
+            self.model_combobox.set("Model Belum Ditemukan")
+        else:
+            selected = self.model_combobox.get()
+            self.model_combobox['values'] = model_files
+            # Pilihan pengguna dipertahankan jika modelnya masih ada
+            if selected in model_files:
+                self.model_combobox.set(selected)
             else:
-                self.model_combobox['values'] = sorted(model_files)
                 self.model_combobox.current(0)
+        self._update_model_info()
+
+    def _update_model_info(self):
+        """Menampilkan ringkasan info model terpilih dari katalog (tanpa memuat bobot)."""
+        self.model_info_label.config(text=self.model_catalog.summary(self.model_combobox.get()))
+
+    def _scan_model_directory(self):
+        """Memeriksa perubahan di direktori model secara berkala dan memperbarui katalog."""
+        # Daftar masih kosong (awal aplikasi) atau masih berisi placeholder dari scan yang gagal sebelumnya
+        needs_reload = self.model_combobox.get() == "Error Memuat Model" or not self.model_combobox['values']
+        try:
+            if self.model_catalog.scan():
+                self._on_model_catalog_changed()
+            elif needs_reload:
+                self._load_existing_models()
         except Exception as e:
+            if self.model_combobox.get() != "Error Memuat Model":
+                self._add_log(f"Gagal membaca direktori model: {e}")  # Dicatat sekali, tidak setiap polling
             self.model_combobox['values'] = ["Error Memuat Model"]
             self.model_combobox.set("Error Memuat Model")
+        self._start_catalog_worker()
+        self.root.after(self.MODEL_DIR_POLL_MS, self._scan_model_directory)
+
+    def _on_model_catalog_changed(self):
+        """Memperbarui semua tampilan yang menggunakan daftar model."""
+        self._load_existing_models()
+        if hasattr(self, 'manage_window') and self.manage_window.winfo_exists():
+            self._populate_models_list()
+
+    def _start_catalog_worker(self):
+        """Menjalankan thread yang menghitung hash dan info model yang belum terindeks."""
+        if self.catalog_thread and self.catalog_thread.is_alive():
+            return
+        if not self.model_catalog.pending_hashes() and not self.model_catalog.pending_metadata():
+            return
+        self.catalog_thread = threading.Thread(target=self._catalog_worker, daemon=True)
+        self.catalog_thread.start()
+
+    def _catalog_worker(self):
+        """Mengindeks model satu per satu di latar belakang, UI diperbarui setiap selesai satu model."""
+        for filename in self.model_catalog.pending_hashes():
+            try:
+                self.model_catalog.hash_file(filename)
+            except OSError:
+                continue  # File sedang disalin atau sudah dihapus, dicoba lagi pada scan berikutnya
+        self.root.after(0, self._update_model_info)
+        for filename in self.model_catalog.pending_metadata():
+            self.model_catalog.extract_metadata(filename)
+            self.root.after(0, self._on_model_catalog_changed)
 
     def _upload_model(self):
         """Mengunggah file model baru ke direktori 'models'."""
@@ -473,9 +1503,12 @@ class GUIDetectorApp:
                  if not messagebox.askyesno("Konfirmasi Timpa", f"Model dengan nama '{filename}' sudah ada. Apakah Anda ingin menimpanya?"):
                      self._add_log(f"Penimpaan model '{filename}' dibatalkan.")
                      return
-            shutil.copy(file_path, destination_path)
+            self.model_catalog.import_file(file_path, filename)
             self._add_log(f"Model '{filename}' berhasil diunggah.")
             self._load_existing_models()
+            self.model_combobox.set(filename)
+            self._update_model_info()
+            self._start_catalog_worker()
         except Exception as e:
             self._add_log(f"Gagal mengunggah model: {e}")
             messagebox.showerror("Gagal Unggah", f"Gagal mengunggah model: {e}")
@@ -493,13 +1526,452 @@ class GUIDetectorApp:
 
         window.deiconify()  # Tampilkan kembali setelah posisi benar
 
+    # --- Fungsi-fungsi untuk Pengaturan Capture Kamera ---
+    def _open_capture_settings_window(self):
+        """Membuka jendela untuk mengatur profil capture kamera (backend, resolusi, FOURCC, buffer)."""
+        self._add_log("Jendela 'Pengaturan Kamera' dibuka.")
+        self.capture_window = tk.Toplevel(self.root)
+        self.capture_window.title("Pengaturan Kamera")
+        self.capture_window.geometry("420x560")
+        self.capture_window.resizable(False, False)
+        self.capture_window.configure(bg=self.COLOR_BACKGROUND)
+        self.capture_window.transient(self.root)
+        self.capture_window.grab_set()
+
+        self._center_window(self.capture_window)
+
+        self.capture_window.after_idle(lambda: self.capture_window.iconbitmap(resource_path("deep-learning.ico")))
+
+        main_frame = ttk.Frame(self.capture_window, padding=20)
+        main_frame.pack(fill="both", expand=True)
+        main_frame.columnconfigure(1, weight=1)
+        ttk.Label(main_frame, text="PROFIL CAPTURE", style='Header.TLabel').grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 15))
+
+        profile = self.capture_profiles.get(self._capture_profile_key(self.camera_index))
+        resolution = f"{profile['width']}x{profile['height']}" if profile.get("width") else "Default"
+        self.capture_vars = {
+            "index": tk.StringVar(value=str(self.camera_index)),
+            "backend": tk.StringVar(value=profile["backend"]),
+            "resolution": tk.StringVar(value=resolution),
+            "fourcc": tk.StringVar(value=profile.get("fourcc") or "Default"),
+            "buffer_size": tk.StringVar(value=str(profile.get("buffer_size") or 1)),
+        }
+        fields = [
+            ("Index Kamera", ttk.Spinbox(main_frame, from_=0, to=9, textvariable=self.capture_vars["index"], width=8,
+                                         command=self._load_capture_settings_fields)),
+            ("Backend", ttk.Combobox(main_frame, state="readonly", textvariable=self.capture_vars["backend"],
+                                     values=list(LowLatencyCapture.BACKENDS))),
+            ("Resolusi", ttk.Combobox(main_frame, state="readonly", textvariable=self.capture_vars["resolution"],
+                                      values=["Default", "640x480", "1280x720", "1920x1080"])),
+            ("FOURCC", ttk.Combobox(main_frame, state="readonly", textvariable=self.capture_vars["fourcc"],
+                                    values=["Default", "MJPG", "YUYV", "H264"])),
+            ("Ukuran Buffer", ttk.Spinbox(main_frame, from_=1, to=10, textvariable=self.capture_vars["buffer_size"], width=8)),
+        ]
+        for row, (label, widget) in enumerate(fields, start=1):
+            ttk.Label(main_frame, text=label).grid(row=row, column=0, sticky="w", pady=5, padx=(0, 10))
+            widget.grid(row=row, column=1, sticky="ew", pady=5)
+
+        ttk.Label(main_frame, text="VIDEO PENGGANTI KAMERA", style='Header.TLabel').grid(row=6, column=0, columnspan=2, sticky="w", pady=(20, 5))
+        self.stand_in_label = ttk.Label(main_frame, font=self.FONT_SMALL, foreground=self.COLOR_DISABLED_TEXT,
+                                        text=os.path.basename(self.camera_stand_in) if self.camera_stand_in else "(Tidak ada, gunakan kamera asli)")
+        self.stand_in_label.grid(row=7, column=0, columnspan=2, sticky="w")
+        stand_in_frame = ttk.Frame(main_frame)
+        stand_in_frame.grid(row=8, column=0, columnspan=2, sticky="ew", pady=5)
+        stand_in_frame.columnconfigure(0, weight=1)
+        stand_in_frame.columnconfigure(1, weight=1)
+        ttk.Button(stand_in_frame, text="Pilih Video...", command=self._select_camera_stand_in).grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        ttk.Button(stand_in_frame, text="Hapus", command=lambda: self._select_camera_stand_in(clear=True)).grid(row=0, column=1, sticky="ew", padx=(5, 0))
+
+        self.measured_label = ttk.Label(main_frame, font=self.FONT_SMALL, foreground=self.COLOR_DISABLED_TEXT)
+        self.measured_label.grid(row=9, column=0, columnspan=2, sticky="w", pady=(15, 0))
+        self._load_capture_settings_fields()
+
+        save_button = ttk.Button(main_frame, text="Simpan Profil", command=self._save_capture_settings, style='Accent.TButton')
+        save_button.grid(row=10, column=0, columnspan=2, sticky="ew", pady=(20, 0))
+
+    def _load_capture_settings_fields(self):
+        """Mengisi ulang field pengaturan sesuai profil dari index kamera yang dipilih."""
+        try:
+            index = int(self.capture_vars["index"].get())
+        except ValueError:
+            return
+        profile = self.capture_profiles.get(self._capture_profile_key(index))
+        self.capture_vars["backend"].set(profile["backend"])
+        self.capture_vars["resolution"].set(f"{profile['width']}x{profile['height']}" if profile.get("width") else "Default")
+        self.capture_vars["fourcc"].set(profile.get("fourcc") or "Default")
+        self.capture_vars["buffer_size"].set(str(profile.get("buffer_size") or 1))
+        measured = profile.get("last_measured")
+        if measured:
+            processed = f", diproses {measured['processed_fps']} FPS" if "processed_fps" in measured else ""
+            self.measured_label.config(text=f"Pengukuran terakhir: capture {measured['fps']} FPS{processed}, "
+                                            f"latensi {measured['latency_ms']} ms ({measured['date']})")
+        else:
+            self.measured_label.config(text="Pengukuran terakhir: belum ada")
+
+    def _select_camera_stand_in(self, clear=False):
+        """Memilih (atau menghapus) file video yang dipakai sebagai pengganti kamera."""
+        if clear:
+            self.camera_stand_in = None
+        else:
+            file_path = filedialog.askopenfilename(filetypes=[("File Video", "*.mp4 *.avi *.mov")], parent=self.capture_window)
+            if not file_path:
+                return
+            self.camera_stand_in = file_path
+        self.stand_in_label.config(text=os.path.basename(self.camera_stand_in) if self.camera_stand_in else "(Tidak ada, gunakan kamera asli)")
+
+    def _save_capture_settings(self):
+        """Menyimpan profil capture untuk index kamera yang dipilih."""
+        try:
+            index = int(self.capture_vars["index"].get())
+            buffer_size = int(self.capture_vars["buffer_size"].get())
+        except ValueError:
+            messagebox.showwarning("Input Tidak Valid", "Index kamera dan ukuran buffer harus berupa angka.", parent=self.capture_window)
+            return
+        resolution = self.capture_vars["resolution"].get()
+        width, height = (int(v) for v in resolution.split("x")) if resolution != "Default" else (None, None)
+        fourcc = self.capture_vars["fourcc"].get()
+        self.camera_index = index
+        self.capture_profiles.update(
+            self._capture_profile_key(index),
+            backend=self.capture_vars["backend"].get(),
+            width=width,
+            height=height,
+            fourcc=None if fourcc == "Default" else fourcc,
+            buffer_size=buffer_size,
+        )
+        self._add_log(f"Profil capture kamera {index} disimpan.")
+        self.capture_window.destroy()
+
+    # --- Fungsi-fungsi untuk Timeline Deteksi Video ---
+    def _open_timeline(self, video_path):
+        """Menampilkan panel timeline untuk video dan memuat indeksnya jika sudah pernah dibuat."""
+        self._close_timeline()
+        self.video_path = video_path
+        self.timeline = DetectionTimeline.load(video_path)
+        if self.timeline:
+            self._add_log(f"Indeks deteksi dimuat ({self.timeline.meta.get('model', '-')}, {self.timeline.meta['date']}).")
+            self.timeline_status_label.config(text=f"Terindeks: {self.timeline.meta.get('model', '-')}")
+        else:
+            self.timeline_status_label.config(text="Video belum diindeks")
+        self.timeline_class_combobox['values'] = ["Semua Kelas"] + (self.timeline.class_names if self.timeline else [])
+        self.timeline_class_combobox.set("Semua Kelas")
+        self.index_button.config(state="normal")
+        self.timeline_frame.grid()
+        self._draw_timeline()
+
+    def _close_timeline(self):
+        """Menyembunyikan panel timeline dan menghentikan pengindeksan yang masih berjalan."""
+        self.index_stop.set()
+        if self.index_retry is not None:
+            self.root.after_cancel(self.index_retry)
+            self.index_retry = None
+        self.video_path = None
+        self.timeline = None
+        self.pending_seek = None
+        self.timeline_frame.grid_remove()
+
+    def _timeline_query(self):
+        """Kelas dan threshold yang dipilih pengguna untuk timeline, class_index None berarti semua kelas."""
+        try:
+            threshold = float(self.timeline_threshold_var.get())
+        except ValueError:
+            threshold = 0.5
+        selected = self.timeline_class_combobox.current()
+        return (selected - 1 if selected > 0 else None), threshold
+
+    def _hex_to_rgb(self, color):
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+    def _draw_timeline(self):
+        """Menggambar strip panas (heat strip) deteksi di sepanjang durasi video."""
+        canvas = self.timeline_canvas
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if width <= 1:
+            return
+        canvas.delete("all")
+        if self.timeline:
+            class_index, threshold = self._timeline_query()
+            row = self.timeline.heat_row(width, class_index, threshold,
+                                         self._hex_to_rgb(self.COLOR_FRAME), self._hex_to_rgb(self.COLOR_DANGER))
+            strip = Image.fromarray(row[None, :, :]).resize((width, height), Image.Resampling.NEAREST)
+            self.timeline_image_tk = ImageTk.PhotoImage(strip)
+            canvas.create_image(0, 0, image=self.timeline_image_tk, anchor="nw")
+        canvas.create_line(0, 0, 0, height, fill=self.COLOR_ACCENT, width=2, tags="playhead")
+        if self.video_capture:
+            self._update_timeline_playhead(self.video_capture.position)
+
+    def _timeline_frame_count(self):
+        if self.timeline:
+            return self.timeline.meta["frame_count"]
+        return self.video_capture.frame_count if self.video_capture else 0
+
+    def _update_timeline_playhead(self, position):
+        """Memindahkan penanda posisi di timeline ke frame yang sedang ditampilkan."""
+        frame_count = self._timeline_frame_count()
+        if not self.video_path or frame_count <= 0:
+            return
+        x = max(position, 0) * self.timeline_canvas.winfo_width() / frame_count
+        self.timeline_canvas.coords("playhead", x, 0, x, self.timeline_canvas.winfo_height())
+
+    def _on_timeline_click(self, event):
+        """Melompat ke posisi video sesuai titik yang diklik di timeline."""
+        frame_count = self._timeline_frame_count()
+        if not self.video_capture or frame_count <= 0:
+            return
+        fraction = min(max(event.x / max(self.timeline_canvas.winfo_width(), 1), 0.0), 1.0)
+        self.pending_seek = min(int(fraction * frame_count), frame_count - 1)
+
+    def _jump_to_match(self, forward=True):
+        """Melompat ke segmen berikutnya/sebelumnya yang cocok dengan kelas dan threshold yang dipilih."""
+        if not self.timeline or not self.video_capture:
+            self.timeline_status_label.config(text="Video belum diindeks")
+            return
+        class_index, threshold = self._timeline_query()
+        frame = self.timeline.find_match(self.video_capture.position, class_index, threshold, forward)
+        if frame is None:
+            self.timeline_status_label.config(text="Tidak ada frame yang cocok")
+            return
+        self.pending_seek = frame
+        fps = self.timeline.meta["fps"]
+        self.timeline_status_label.config(text=f"Frame {frame} ({frame / fps:.1f} detik)")
+
+    def _start_video_indexing(self):
+        """Menjalankan deteksi ke seluruh video di latar belakang untuk membuat indeks timeline."""
+        model_file = self.model_combobox.get()
+        if model_file not in self.model_catalog.model_files():
+            self.index_button.config(state="normal")
+            messagebox.showwarning("Model Belum Dipilih", "Silakan pilih model analisis yang valid dari daftar.")
+            return
+        if self.index_thread and self.index_thread.is_alive():
+            # Pengindeksan video sebelumnya sudah dibatalkan, tapi masih menyelesaikan inferensi yang sedang berjalan
+            self.index_button.config(state="disabled")
+            self.timeline_status_label.config(text="Menunggu pengindeksan sebelumnya berhenti...")
+            self.index_retry = self.root.after(500, self._retry_video_indexing)
+            return
+        rate = self.INDEX_SAMPLE_RATES[self.index_rate_combobox.get()]
+        fps = self.video_capture.native_fps if self.video_capture else 0
+        stride = max(1, round(fps / rate)) if rate and fps else 1
+        try:
+            profile = self.inference_profiles.get(self._inference_profile_key(model_file))
+        except OSError as e:
+            messagebox.showerror("Gagal Membaca Model", f"File model tidak dapat dibaca:\n{e}")
+            return
+        self.index_stop = threading.Event()
+        self.index_button.config(state="disabled")
+        self.timeline_status_label.config(text="Mengindeks... 0%")
+        self._add_log(f"Pengindeksan video dimulai dengan model {model_file} (setiap {stride} frame).")
+        self.index_thread = threading.Thread(
+            target=self._video_indexing_worker,
+            args=(self.video_path, model_file, self._inference_kwargs(profile), stride, self.index_stop),
+            daemon=True)
+        self.index_thread.start()
+
+    def _retry_video_indexing(self):
+        """Mencoba lagi memulai pengindeksan setelah menunggu thread sebelumnya."""
+        self.index_retry = None
+        self._start_video_indexing()
+
+    def _video_indexing_worker(self, video_path, model_file, predict_kwargs, stride, stop_event):
+        """Memuat model terpisah (agar tidak bentrok dengan thread video) lalu membangun dan menyimpan indeks."""
+        try:
+            model = YOLO(os.path.join(self.MODEL_DIR, model_file))
+            timeline = DetectionTimeline.build(
+                video_path, model, predict_kwargs, stride,
+                progress=lambda frame, total: self.root.after(0, self._update_indexing_progress, video_path, frame, total),
+                should_stop=stop_event.is_set)
+            if timeline is not None:
+                timeline.meta["model"] = model_file
+                timeline.save(video_path)
+        except Exception as e:
+            self.root.after(0, self._finish_video_indexing, video_path, None, str(e))
+            return
+        self.root.after(0, self._finish_video_indexing, video_path, timeline, None)
+
+    def _update_indexing_progress(self, video_path, frame, total):
+        if video_path == self.video_path and total > 0:
+            self.timeline_status_label.config(text=f"Mengindeks... {frame * 100 // total}%")
+
+    def _finish_video_indexing(self, video_path, timeline, error):
+        """Menampilkan hasil pengindeksan jika video yang sama masih dibuka."""
+        if error:
+            self._add_log(f"Pengindeksan video gagal: {error}")
+        elif timeline is None:
+            self._add_log("Pengindeksan video dibatalkan.")
+        else:
+            self._add_log(f"Indeks deteksi disimpan: {os.path.basename(DetectionTimeline.index_path(video_path))}")
+        if video_path != self.video_path:
+            return
+        self.index_button.config(state="normal")
+        if error:
+            self.timeline_status_label.config(text="Pengindeksan gagal")
+            messagebox.showerror("Pengindeksan Gagal", f"Terjadi kesalahan saat mengindeks video:\n{error}")
+            return
+        if timeline is None:
+            return
+        self.timeline = timeline
+        self.timeline_class_combobox['values'] = ["Semua Kelas"] + timeline.class_names
+        self.timeline_class_combobox.set("Semua Kelas")
+        self.timeline_status_label.config(text=f"Terindeks: {timeline.meta['model']}")
+        self._draw_timeline()
+
+    # --- Fungsi-fungsi untuk Tuning Inferensi ---
+    def _open_tuner_window(self):
+        """Membuka jendela untuk mencari pengaturan inferensi terbaik bagi model terpilih di mesin ini."""
+        model_file = self.model_combobox.get()
+        if model_file not in self.model_catalog.model_files():
+            messagebox.showwarning("Model Belum Dipilih", "Silakan pilih model analisis yang valid dari daftar.")
+            return
+        try:
+            profile_key = self._inference_profile_key(model_file)
+        except OSError as e:
+            messagebox.showerror("Gagal Membaca Model", f"File model tidak dapat dibaca:\n{e}")
+            return
+        self._add_log("Jendela 'Tuning Inferensi' dibuka.")
+        self.tuner_model_file = model_file
+        self.tuner_profile_key = profile_key
+        self.tuner_clips = []
+        self.tuner_stop = threading.Event()
+        self.tuner_window = tk.Toplevel(self.root)
+        self.tuner_window.title("Tuning Inferensi")
+        self.tuner_window.geometry("460x600")
+        self.tuner_window.minsize(420, 560)
+        self.tuner_window.configure(bg=self.COLOR_BACKGROUND)
+        self.tuner_window.transient(self.root)
+        self.tuner_window.grab_set()
+        self.tuner_window.protocol("WM_DELETE_WINDOW", self._close_tuner_window)
+
+        self._center_window(self.tuner_window)
+
+        self.tuner_window.after_idle(lambda: self.tuner_window.iconbitmap(resource_path("deep-learning.ico")))
+
+        main_frame = ttk.Frame(self.tuner_window, padding=20)
+        main_frame.pack(fill="both", expand=True)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(4, weight=1)
+        ttk.Label(main_frame, text="TUNING INFERENSI", style='Header.TLabel').grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 5))
+        ttk.Label(main_frame, text=f"{model_file} @ {platform.node()}", font=self.FONT_SMALL,
+                  foreground=self.COLOR_DISABLED_TEXT).grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 10))
+
+        profile = self.inference_profiles.get(profile_key)
+        self.tuner_conf_var = tk.StringVar(value=str(profile["conf"]))
+        self.tuner_iou_var = tk.StringVar(value=str(profile["iou"]))
+        ttk.Label(main_frame, text="Confidence").grid(row=2, column=0, sticky="w", pady=5, padx=(0, 10))
+        ttk.Spinbox(main_frame, from_=0.05, to=0.95, increment=0.05, textvariable=self.tuner_conf_var, width=8).grid(row=2, column=1, sticky="w", pady=5)
+        ttk.Label(main_frame, text="IoU NMS").grid(row=3, column=0, sticky="w", pady=5, padx=(0, 10))
+        ttk.Spinbox(main_frame, from_=0.1, to=0.95, increment=0.05, textvariable=self.tuner_iou_var, width=8).grid(row=3, column=1, sticky="w", pady=5)
+
+        # Daftar kelas dari katalog, kelas yang dipilih menjadi filter deteksi (kosong = semua kelas)
+        class_names = (self.model_catalog.get(model_file) or {}).get("class_names") or []
+        self.tuner_class_listbox = tk.Listbox(main_frame, selectmode="multiple", bg=self.COLOR_FRAME, fg=self.COLOR_TEXT,
+                                              selectbackground=self.COLOR_ACCENT, font=self.FONT_SMALL,
+                                              highlightthickness=0, borderwidth=0, exportselection=False)
+        for index, name in enumerate(class_names):
+            self.tuner_class_listbox.insert(tk.END, name)
+            if profile["classes"] and index in profile["classes"]:
+                self.tuner_class_listbox.selection_set(index)
+        ttk.Label(main_frame, text="Filter Kelas").grid(row=4, column=0, sticky="nw", pady=5, padx=(0, 10))
+        self.tuner_class_listbox.grid(row=4, column=1, sticky="nsew", pady=5)
+
+        clip_frame = ttk.Frame(main_frame)
+        clip_frame.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+        clip_frame.columnconfigure(0, weight=1)
+        self.tuner_clip_label = ttk.Label(clip_frame, text="Sampel: sample_image/ (tanpa klip video)", font=self.FONT_SMALL)
+        self.tuner_clip_label.grid(row=0, column=0, sticky="w")
+        ttk.Button(clip_frame, text="+ Klip", command=self._add_tuner_clip).grid(row=0, column=1, sticky="e")
+
+        self.tuner_progress = ttk.Progressbar(main_frame, orient="horizontal", mode='determinate')
+        self.tuner_progress.grid(row=6, column=0, columnspan=2, sticky="ew", pady=(15, 5))
+        self.tuner_result_label = ttk.Label(main_frame, font=self.FONT_SMALL, foreground=self.COLOR_DISABLED_TEXT, wraplength=400,
+                                            text=self._describe_inference_profile(profile))
+        self.tuner_result_label.grid(row=7, column=0, columnspan=2, sticky="w")
+        self.tuner_start_button = ttk.Button(main_frame, text="▶  Mulai Tuning", command=self._start_tuning, style='Success.TButton')
+        self.tuner_start_button.grid(row=8, column=0, columnspan=2, sticky="ew", pady=(15, 0))
+
+    def _describe_inference_profile(self, profile):
+        """Ringkasan profil inferensi untuk ditampilkan di jendela tuning."""
+        if "date" not in profile:
+            return "Belum ada profil untuk mesin ini, pengaturan bawaan digunakan."
+        speedup = profile["reference_latency_ms"] / profile["latency_ms"] if profile["latency_ms"] else 1.0
+        return (f"Profil ({profile['date']}): imgsz {profile['imgsz']}, half {profile['half']}, "
+                f"{profile['threads'] or 'default'} thread, {profile['latency_ms']} ms "
+                f"({speedup:.1f}x lebih cepat), kesesuaian {profile['agreement'] * 100:.0f}%")
+
+    def _add_tuner_clip(self):
+        """Menambahkan klip video sebagai sampel tambahan untuk tuning."""
+        file_path = filedialog.askopenfilename(filetypes=[("File Video", "*.mp4 *.avi *.mov")], parent=self.tuner_window)
+        if not file_path:
+            return
+        self.tuner_clips.append(file_path)
+        self.tuner_clip_label.config(text=f"Sampel: sample_image/ + {len(self.tuner_clips)} klip video")
+
+    def _start_tuning(self):
+        """Memulai tuning di thread terpisah agar UI tidak macet."""
+        try:
+            conf = float(self.tuner_conf_var.get())
+            iou = float(self.tuner_iou_var.get())
+        except ValueError:
+            messagebox.showwarning("Input Tidak Valid", "Confidence dan IoU harus berupa angka.", parent=self.tuner_window)
+            return
+        classes = list(self.tuner_class_listbox.curselection()) or None
+        self._stop_prediction()  # Jumlah thread torch diubah-ubah selama tuning
+        self.tuner_start_button.config(state="disabled")
+        self._add_log(f"Tuning inferensi dimulai untuk model: {self.tuner_model_file}")
+        threading.Thread(target=self._tuning_worker, args=(conf, iou, classes), daemon=True).start()
+
+    def _tuning_worker(self, conf, iou, classes):
+        """Memuat model dan sampel, menjalankan InferenceTuner, lalu menyimpan profil terbaik."""
+        model_file = self.tuner_model_file
+        profile_key = self.tuner_profile_key
+        try:
+            samples = InferenceTuner.load_samples(self.SAMPLE_IMAGE_DIR, self.tuner_clips)
+            if not samples:
+                raise ValueError("Tidak ada gambar sampel di sample_image/ atau klip video.")
+            model = YOLO(os.path.join(self.MODEL_DIR, model_file))
+            tuner = InferenceTuner(model, self._model_imgsz(model_file), conf, iou, classes)
+            profile = tuner.run(
+                samples,
+                progress=lambda done, total: self.root.after(0, self._update_tuner_progress, done, total),
+                should_stop=self.tuner_stop.is_set)
+        except Exception as e:
+            self.root.after(0, self._finish_tuning, model_file, profile_key, None, str(e))
+            return
+        self.root.after(0, self._finish_tuning, model_file, profile_key, profile, None)
+
+    def _update_tuner_progress(self, done, total):
+        if self.tuner_window.winfo_exists():
+            self.tuner_progress.config(maximum=total, value=done)
+
+    def _finish_tuning(self, model_file, profile_key, profile, error):
+        """Menyimpan hasil tuning dan menerapkannya jika model tersebut sedang dimuat."""
+        if error:
+            self._add_log(f"Tuning inferensi gagal: {error}")
+            if self.tuner_window.winfo_exists():
+                messagebox.showerror("Tuning Gagal", f"Terjadi kesalahan saat tuning:\n{error}", parent=self.tuner_window)
+                self.tuner_start_button.config(state="normal")
+            return
+        if profile is None:
+            self._add_log("Tuning inferensi dibatalkan.")
+            return
+        self.inference_profiles.update(profile_key, **profile)
+        self._add_log(f"Tuning inferensi selesai: imgsz {profile['imgsz']}, {profile['latency_ms']} ms.")
+        if model_file == self.model_name:
+            self._apply_inference_profile(model_file, profile_key)
+        if self.tuner_window.winfo_exists():
+            self.tuner_result_label.config(text=self._describe_inference_profile(profile))
+            self.tuner_start_button.config(state="normal")
+
+    def _close_tuner_window(self):
+        """Menutup jendela tuning dan menghentikan tuning yang masih berjalan."""
+        self.tuner_stop.set()
+        self.tuner_window.destroy()
+
     # --- Fungsi-fungsi untuk Manajemen Model ---
     def _open_manage_models_window(self):
         """Membuka jendela baru untuk mengelola (menghapus) model."""
         self._add_log("Jendela 'Kelola Model' dibuka.")
         self.manage_window = tk.Toplevel(self.root)
         self.manage_window.title("Kelola Model")
-        self.manage_window.geometry("400x450")
+        self.manage_window.geometry("640x450")
         self.manage_window.minsize(350, 400)
         self.manage_window.configure(bg=self.COLOR_BACKGROUND)
         self.manage_window.transient(self.root)
@@ -514,9 +1986,15 @@ class GUIDetectorApp:
         main_frame.rowconfigure(1, weight=1)
         main_frame.columnconfigure(0, weight=1)
         ttk.Label(main_frame, text="DAFTAR MODEL TERSEDIA", style='Header.TLabel').grid(row=0, column=0, sticky="w", pady=(0, 15))
-        self.models_list_treeview = ttk.Treeview(main_frame, columns=('model',), show='headings', selectmode='browse')
+        self.models_list_treeview = ttk.Treeview(main_frame, columns=('model', 'task', 'kelas', 'latensi'), show='headings', selectmode='browse')
         self.models_list_treeview.heading('model', text='Nama File Model', anchor='w')
+        self.models_list_treeview.heading('task', text='Task', anchor='center')
+        self.models_list_treeview.heading('kelas', text='Kelas', anchor='center')
+        self.models_list_treeview.heading('latensi', text='Latensi', anchor='center')
         self.models_list_treeview.column('model', anchor='w')
+        self.models_list_treeview.column('task', width=80, anchor='center')
+        self.models_list_treeview.column('kelas', width=70, anchor='center')
+        self.models_list_treeview.column('latensi', width=80, anchor='center')
         self.models_list_treeview.grid(row=1, column=0, sticky="nsew")
         delete_button = ttk.Button(main_frame, text="Hapus Model Terpilih", command=self._delete_selected_model, style='Danger.TButton')
         delete_button.grid(row=2, column=0, sticky="ew", pady=(15, 0))
@@ -527,10 +2005,17 @@ class GUIDetectorApp:
         for item in self.models_list_treeview.get_children():
             self.models_list_treeview.delete(item)
         try:
-            model_files = [f for f in os.listdir(self.MODEL_DIR) if f.endswith(('.pt', '.weights'))]
+            model_files = self.model_catalog.model_files()
             if model_files:
-                for model_file in sorted(model_files):
-                    self.models_list_treeview.insert('', 'end', values=(model_file,))
+                for model_file in model_files:
+                    entry = self.model_catalog.get(model_file) or {}
+                    latency = entry.get("latency_ms")
+                    self.models_list_treeview.insert('', 'end', values=(
+                        model_file,
+                        entry.get("task", "-"),
+                        len(entry["class_names"]) if entry.get("class_names") else "-",
+                        f"{latency:.0f} ms" if latency is not None else "-",
+                    ))
             else:
                 self.models_list_treeview.insert('', 'end', values=("(Tidak ada model di direktori)",), tags=('disabled_item',))
                 self.models_list_treeview.tag_configure('disabled_item', foreground=self.COLOR_DISABLED_TEXT)
@@ -553,6 +2038,7 @@ class GUIDetectorApp:
                 model_path = os.path.join(self.MODEL_DIR, selected_model_filename)
                 os.remove(model_path)
                 self._add_log(f"Model '{selected_model_filename}' berhasil dihapus.")
+                self.model_catalog.scan()
                 self._populate_models_list()
                 self._load_existing_models()
                 messagebox.showinfo("Berhasil", f"Model '{selected_model_filename}' telah dihapus.", parent=self.manage_window)
@@ -698,6 +2184,8 @@ class GUIDetectorApp:
         self._add_log("Aplikasi ditutup.")
         print("Menutup aplikasi...")
         self._stop_current_feed()
+        self.index_stop.set()
+        self.model_catalog.save()
         self.root.destroy()
 
 class SplashScreen: